@@ -0,0 +1,42 @@
+import asyncio
+import weakref
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+# BaseUpdateProcessor's own semaphore is taken before do_process_update runs, i.e. before we know
+# whether the chat is busy. Give it an effectively unlimited size and bound concurrency ourselves.
+_UNBOUNDED = 2 ** 31 - 1
+
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Handles updates from different chats concurrently, but keeps updates from the same chat in order,
+    so conversation states never see two messages of one user at once.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(_UNBOUNDED)
+        self._slots = asyncio.BoundedSemaphore(max_concurrent_updates)
+        self._chat_locks = weakref.WeakValueDictionary()
+
+    async def do_process_update(self, update, coroutine):
+        # Wait for the chat's turn *before* taking a concurrency slot, so a flooding
+        # chat queues behind its own lock instead of holding slots other chats need.
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            async with self._slots:
+                await coroutine
+            return
+
+        lock = self._chat_locks.get(chat.id)
+        if lock is None:
+            lock = self._chat_locks[chat.id] = asyncio.Lock()
+        async with lock, self._slots:
+            await coroutine
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
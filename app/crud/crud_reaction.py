@@ -1,13 +1,50 @@
-from sqlalchemy.orm import Session
-from app.models.models import Reaction, ReactionType
+from sqlalchemy import Integer, cast, exists, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Match, Reaction, ReactionType, Task, User
 
-def create_reaction(db: Session, from_user_id: int, to_user_id: int, reaction_type: ReactionType):
-    reaction = Reaction(
-        from_user_id=from_user_id,
-        to_user_id=to_user_id,
-        reaction_type=reaction_type
-    )
-    db.add(reaction)
-    db.commit()
-    db.refresh(reaction)
-    return reaction
+def _like_task_statement(from_user_id: int, task_id: int):
+    # Data-modifying CTEs, so Postgres only. Both INSERTs select FROM target, so an unknown
+    # task yields no rows and writes nothing.
+    user_id = literal(from_user_id, Integer)
+    target = (
+        select(Task.owner_id, User.telegram_id.label("owner_telegram_id"))
+        .join(User, User.id == Task.owner_id)
+        .where(Task.id == task_id)
+        .cte("target")
+    )
+    # Every sub-statement sees the same snapshot, so this does not see the reaction inserted below.
+    mutual = exists().where(
+        Reaction.from_user_id == target.c.owner_id,
+        Reaction.to_user_id == user_id,
+        Reaction.reaction_type == ReactionType.LIKE
+    )
+    new_reaction = (
+        insert(Reaction)
+        .from_select(
+            ["from_user_id", "to_user_id", "reaction_type"],
+            select(user_id, target.c.owner_id,
+                   cast(literal(ReactionType.LIKE.name), Reaction.__table__.c.reaction_type.type))
+        )
+        .returning(Reaction.id)
+        .cte("new_reaction")
+    )
+    new_match = (
+        insert(Match)
+        .from_select(["user1_id", "user2_id"], select(user_id, target.c.owner_id).where(mutual))
+        .returning(Match.id)
+        .cte("new_match")
+    )
+    return (
+        select(target.c.owner_telegram_id, exists(select(new_match.c.id)).label("is_match"))
+        .add_cte(new_reaction)
+    )
+
+async def like_task(db: AsyncSession, from_user_id: int, task_id: int):
+    """
+    Like the owner of a task and record a match if the owner already liked the user back,
+    all in one round-trip. Returns a row (owner_telegram_id, is_match), or None if the task
+    does not exist (in which case nothing is written).
+    """
+    row = (await db.execute(_like_task_statement(from_user_id, task_id))).one_or_none()
+    await db.commit()
+    return row
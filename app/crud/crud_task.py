@@ -0,0 +1,28 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Task
+
+async def create_task(db: AsyncSession, owner_id: int, description: str, timeframe: str = None,
+                      reward: str = None, categories: str = None):
+    task = Task(
+        owner_id=owner_id,
+        description=description,
+        timeframe=timeframe,
+        reward=reward,
+        categories=categories
+    )
+    db.add(task)
+    await db.commit()
+    return task
+
+async def get_task_summaries(db: AsyncSession, offset: int = 0, limit: int = 20):
+    # Only the columns the task list shows, as plain rows: no ORM hydration, no timeframe/owner_id
+    result = await db.execute(
+        select(Task.id, Task.description, Task.categories, Task.reward)
+        .order_by(Task.id.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+    await db.commit()
+    return rows
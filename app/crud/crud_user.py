@@ -0,0 +1,61 @@
+from cachetools import TTLCache
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User, UserRole
+
+# Write-through cache of User rows keyed by telegram_id; nearly every update looks the sender up.
+# Cached instances are detached, so they are for reading only -- mutate through update_user.
+# Every helper here ends its transaction before returning, so the pooled connection goes back
+# while the caller is still talking to Telegram (expire_on_commit=False keeps loaded values).
+user_cache = TTLCache(maxsize=10_000, ttl=300)
+
+def _cache_user(db: AsyncSession, user: User):
+    # Expunge so a later rollback/close of this session can't expire the cached instance
+    db.expunge(user)
+    user_cache[user.telegram_id] = user
+
+async def _fetch_user(db: AsyncSession, telegram_id: int):
+    result = await db.execute(select(User).where(User.telegram_id == telegram_id))
+    return result.scalar_one_or_none()
+
+async def get_user_by_telegram_id(db: AsyncSession, telegram_id: int):
+    user = user_cache.get(telegram_id)
+    if user is None:
+        user = await _fetch_user(db, telegram_id)
+        await db.commit()
+        if user:
+            _cache_user(db, user)
+    return user
+
+async def create_user(db: AsyncSession, telegram_id: int, name: str, role: UserRole,
+                      description: str = None, categories: str = None):
+    user = User(
+        telegram_id=telegram_id,
+        name=name,
+        role=role,
+        description=description,
+        categories=categories
+    )
+    db.add(user)
+    await db.commit()
+    _cache_user(db, user)
+    return user
+
+async def update_user(db: AsyncSession, telegram_id: int, **fields):
+    user = await _fetch_user(db, telegram_id)
+    if not user:
+        await db.commit()
+        user_cache.pop(telegram_id, None)
+        return None
+    for field, value in fields.items():
+        setattr(user, field, value)
+    await db.commit()
+    _cache_user(db, user)
+    return user
+
+async def delete_user(db: AsyncSession, telegram_id: int):
+    # Single DELETE; the user's tasks, reactions and matches go with it via ON DELETE CASCADE
+    result = await db.execute(delete(User).where(User.telegram_id == telegram_id))
+    await db.commit()
+    user_cache.pop(telegram_id, None)
+    return result.rowcount > 0
@@ -0,0 +1,65 @@
+import enum
+
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from app.db.database import Base
+
+
+class UserRole(enum.Enum):
+    TALENT = "TALENT"
+    EMPLOYER = "EMPLOYER"
+
+
+class ReactionType(enum.Enum):
+    LIKE = "LIKE"
+    DISLIKE = "DISLIKE"
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    telegram_id = Column(BigInteger, unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    role = Column(Enum(UserRole), nullable=False)
+    description = Column(Text)
+    categories = Column(String)
+    university = Column(String)
+    study_year = Column(Integer)
+
+    tasks = relationship("Task", back_populates="owner", passive_deletes=True)
+
+
+class Task(Base):
+    __tablename__ = "tasks"
+
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    description = Column(Text, nullable=False)
+    timeframe = Column(String)
+    reward = Column(String)
+    categories = Column(String)
+
+    owner = relationship("User", back_populates="tasks")
+
+
+class Reaction(Base):
+    __tablename__ = "reactions"
+    __table_args__ = (
+        # Serves the mutual-like probe in like_task: "did the task owner already like this user?"
+        Index("ix_reactions_mutual", "from_user_id", "to_user_id", "reaction_type"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    from_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    to_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    reaction_type = Column(Enum(ReactionType), nullable=False)
+
+
+class Match(Base):
+    __tablename__ = "matches"
+
+    id = Column(Integer, primary_key=True)
+    user1_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user2_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,35 @@
+import functools
+import threading
+
+from cachetools import LRUCache
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def cache_truthy_results(func, maxsize: int):
+    """
+    LRU-memoize a one-argument text function on its normalized input. Falsy results (e.g. an LLM
+    call that failed or timed out) are returned but not cached, so the next request tries again.
+    Safe to call from worker threads.
+    """
+    cache = LRUCache(maxsize=maxsize)
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(text: str):
+        key = normalize_text(text)
+        with lock:
+            result = cache.get(key)
+        if result is not None:
+            return result
+
+        result = func(key)
+        if result:
+            with lock:
+                cache[key] = result
+        return result
+
+    wrapper.cache = cache
+    return wrapper
@@ -1,21 +1,29 @@
+import asyncio
 import logging
 import traceback
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from telegram import (
     Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, InlineKeyboardButton, InlineKeyboardMarkup
 )
 from telegram.ext import (
-    ApplicationBuilder, CommandHandler, MessageHandler, filters,
-    ConversationHandler, ContextTypes, CallbackQueryHandler
+    ApplicationBuilder, CommandHandler, MessageHandler, TypeHandler, filters,
+    ConversationHandler, ContextTypes, CallbackQueryHandler, AIORateLimiter
 )
 
-from app.config.settings import TELEGRAM_BOT_TOKEN
-from app.db.database import SessionLocal
-from app.crud.crud_user import create_user, get_user_by_telegram_id, update_user
-from app.crud.crud_task import create_task, get_all_tasks, get_task_by_id
-from app.crud.crud_reaction import create_reaction, check_mutual_like, create_match
-from app.models.models import UserRole, ReactionType
+from app.bots.update_processor import PerChatUpdateProcessor
+from app.config.settings import TELEGRAM_BOT_TOKEN, WEBHOOK_URL, WEBHOOK_LISTEN, WEBHOOK_PORT, WEBHOOK_SECRET
+from app.db.database import async_session
+from app.crud.crud_user import create_user, delete_user, get_user_by_telegram_id, update_user
+from app.crud.crud_task import create_task, get_task_summaries
+from app.crud.crud_reaction import like_task
+from app.models.models import UserRole
 from app.services.llm_service import categorize_text
+from app.utils.helpers import cache_truthy_results
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +35,8 @@ ASK_TASK_DESC, ASK_TASK_TIMEFRAME, ASK_TASK_REWARD = range(3)
 EDIT_FIELD, EDIT_VALUE = range(2)
 CONFIRM_DELETE = range(1)
 
+TASKS_PAGE_SIZE = 20
+
 #####################
 # Main Menu
 #####################
@@ -36,64 +46,88 @@ main_menu_keyboard = [
 ]
 main_menu_markup = ReplyKeyboardMarkup(main_menu_keyboard, resize_keyboard=True, one_time_keyboard=False)
 
+role_keyboard = [["TALENT", "EMPLOYER"]]
+role_markup = ReplyKeyboardMarkup(role_keyboard, one_time_keyboard=True)
+
 #####################
 # Inline Keyboards for Profile Management
 #####################
-def profile_inline_keyboard():
-    buttons = [
-        [InlineKeyboardButton("Edit Profile", callback_data="edit_profile"),
-         InlineKeyboardButton("Save Profile", callback_data="save_profile")]
-    ]
-    return InlineKeyboardMarkup(buttons)
-
-def edit_fields_inline_keyboard():
-    buttons = [
-        [InlineKeyboardButton("Name", callback_data="edit_name"),
-         InlineKeyboardButton("Description", callback_data="edit_description")],
-        [InlineKeyboardButton("University", callback_data="edit_university"),
-         InlineKeyboardButton("Study Year", callback_data="edit_study_year")],
-        [InlineKeyboardButton("Cancel Editing", callback_data="cancel_editing")]
-    ]
-    return InlineKeyboardMarkup(buttons)
+# Markups are immutable, so they are built once here instead of on every reply
+profile_inline_markup = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Edit Profile", callback_data="edit_profile"),
+     InlineKeyboardButton("Save Profile", callback_data="save_profile")]
+])
+
+edit_fields_inline_markup = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Name", callback_data="edit_name"),
+     InlineKeyboardButton("Description", callback_data="edit_description")],
+    [InlineKeyboardButton("University", callback_data="edit_university"),
+     InlineKeyboardButton("Study Year", callback_data="edit_study_year")],
+    [InlineKeyboardButton("Cancel Editing", callback_data="cancel_editing")]
+])
+
+cancel_editing_inline_markup = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Cancel Editing", callback_data="cancel_editing")]
+])
+
+def tasks_page_inline_keyboard(page: int, has_next: bool):
+    buttons = []
+    if page > 0:
+        buttons.append(InlineKeyboardButton("« Prev", callback_data=f"tasks:{page - 1}"))
+    if has_next:
+        buttons.append(InlineKeyboardButton("Next »", callback_data=f"tasks:{page + 1}"))
+    return InlineKeyboardMarkup([buttons]) if buttons else None
 
 #####################
 # Utility Functions
 #####################
-def show_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    telegram_user_id = update.effective_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    db.close()
-    if not user:
-        return update.message.reply_text("You are not registered. Use /register first.", reply_markup=main_menu_markup)
+# Many descriptions differ only in case/spacing, so the cache is keyed on the normalized text
+categorize = cache_truthy_results(categorize_text, maxsize=4096)
+
+profile_template = (
+    "Your Profile:\n"
+    "Name: {name}\n"
+    "Role: {role}\n"
+    "Description: {description}\n"
+    "Categories: {categories}\n"
+    "University: {university}\n"
+    "Study Year: {study_year}"
+)
 
-    msg = (f"Your Profile:\n"
-           f"Name: {user.name}\n"
-           f"Role: {user.role.value}\n"
-           f"Description: {user.description or 'N/A'}\n"
-           f"Categories: {user.categories or 'N/A'}\n"
-           f"University: {user.university or 'N/A'}\n"
-           f"Study Year: {user.study_year if user.study_year is not None else 'N/A'}")
+def _render_profile(user):
+    return profile_template.format(
+        name=user.name,
+        role=user.role.value,
+        description=user.description or "N/A",
+        categories=user.categories or "N/A",
+        university=user.university or "N/A",
+        study_year=user.study_year if user.study_year is not None else "N/A"
+    )
 
-    return update.message.reply_text(msg, reply_markup=profile_inline_keyboard())
+async def show_profile(update: Update, context: ContextTypes.DEFAULT_TYPE, user=None):
+    # effective_message so this also works when triggered from an inline button (sends a new message).
+    # Callers that already looked the user up pass it in to skip the second fetch.
+    if user is None:
+        user = await get_user_by_telegram_id(context.db, update.effective_user.id)
+    if not user:
+        await update.effective_message.reply_text("You are not registered. Use /register first.",
+                                                  reply_markup=main_menu_markup)
+        return
 
-async def show_profile_in_new_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    telegram_user_id = update.effective_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    db.close()
-    msg = (f"Your Profile:\n"
-           f"Name: {user.name}\n"
-           f"Role: {user.role.value}\n"
-           f"Description: {user.description or 'N/A'}\n"
-           f"Categories: {user.categories or 'N/A'}\n"
-           f"University: {user.university or 'N/A'}\n"
-           f"Study Year: {user.study_year if user.study_year is not None else 'N/A'}")
-    await update.effective_message.reply_text(msg, reply_markup=profile_inline_keyboard())
+    await update.effective_message.reply_text(_render_profile(user), reply_markup=profile_inline_markup)
 
 #####################
 # Global Handlers
 #####################
+async def open_db_session(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    # One session per update, shared by every handler (and nested helper) that runs for it
+    context.db = async_session()
+
+async def close_db_session(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    db = getattr(context, "db", None)
+    if db is not None:
+        await db.close()
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(
         "Welcome to Innovedge Bot!\nUse /register to create your profile.",
@@ -114,10 +148,9 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
 # Registration Flow
 #####################
 async def register_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    role_keyboard = [["TALENT", "EMPLOYER"]]
     await update.message.reply_text(
         "Are you registering as TALENT or EMPLOYER?",
-        reply_markup=ReplyKeyboardMarkup(role_keyboard, one_time_keyboard=True)
+        reply_markup=role_markup
     )
     return ASK_ROLE
 
@@ -145,18 +178,16 @@ async def received_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def received_skills(update: Update, context: ContextTypes.DEFAULT_TYPE):
     skills_description = update.message.text.strip()
     telegram_user_id = update.message.from_user.id
-    categories = categorize_text(skills_description)
+    categories = await asyncio.to_thread(categorize, skills_description)
 
-    db = SessionLocal()
-    new_user = create_user(
-        db=db,
+    new_user = await create_user(
+        db=context.db,
         telegram_id=telegram_user_id,
         name=context.user_data["name"],
         role=context.user_data["role"],
         description=skills_description,
         categories=categories if categories else None
     )
-    db.close()
 
     await update.message.reply_text(
         f"Registered {new_user.name} as {new_user.role.value}! Categories: {new_user.categories or 'None'}",
@@ -179,9 +210,7 @@ register_conv = ConversationHandler(
 #####################
 async def post_task_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     telegram_user_id = update.message.from_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    db.close()
+    user = await get_user_by_telegram_id(context.db, telegram_user_id)
     if not user or user.role != UserRole.EMPLOYER:
         await update.message.reply_text("Only employers can post tasks.", reply_markup=main_menu_markup)
         return ConversationHandler.END
@@ -202,20 +231,18 @@ async def received_task_timeframe(update: Update, context: ContextTypes.DEFAULT_
 async def received_task_reward(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data["task_reward"] = update.message.text
     description = context.user_data["task_desc"]
-    categories = categorize_text(description)
+    categories = await asyncio.to_thread(categorize, description)
 
     telegram_user_id = update.message.from_user.id
-    db = SessionLocal()
-    employer_user = get_user_by_telegram_id(db, telegram_user_id)
-    new_task = create_task(
-        db=db,
+    employer_user = await get_user_by_telegram_id(context.db, telegram_user_id)
+    new_task = await create_task(
+        db=context.db,
         owner_id=employer_user.id,
         description=description,
         timeframe=context.user_data["task_timeframe"],
         reward=context.user_data["task_reward"],
         categories=categories if categories else None
     )
-    db.close()
 
     await update.message.reply_text(
         f"Task posted successfully with ID {new_task.id}! Categories: {new_task.categories or 'None'}",
@@ -237,24 +264,18 @@ post_task_conv = ConversationHandler(
 # Profile and Editing Handlers
 #####################
 async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    telegram_user_id = update.effective_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    db.close()
-    if not user:
-        await update.message.reply_text("You are not registered. Use /register first.", reply_markup=main_menu_markup)
-        return
-    show_profile(update, context)
+    # show_profile does the lookup and the "not registered" reply itself
+    await show_profile(update, context)
 
 async def profile_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
     if query.data == "edit_profile":
-        await query.edit_message_reply_markup(reply_markup=edit_fields_inline_keyboard())
+        await query.edit_message_reply_markup(reply_markup=edit_fields_inline_markup)
     elif query.data == "save_profile":
         await query.edit_message_text(text="Profile saved (no changes)!")
-        await show_profile_in_new_message(update, context)
+        await show_profile(update, context)
 
 async def edit_profile_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
@@ -262,7 +283,7 @@ async def edit_profile_callback(update: Update, context: ContextTypes.DEFAULT_TY
 
     if query.data == "cancel_editing":
         await query.edit_message_text("Editing canceled.")
-        await show_profile_in_new_message(update, context)
+        await show_profile(update, context)
         return ConversationHandler.END
 
     field_map = {
@@ -276,7 +297,7 @@ async def edit_profile_callback(update: Update, context: ContextTypes.DEFAULT_TY
         context.user_data["editing_field"] = field_map[query.data]
         await query.edit_message_text(
             f"Enter new value for {field_map[query.data]}:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("Cancel Editing", callback_data="cancel_editing")]])
+            reply_markup=cancel_editing_inline_markup
         )
         return EDIT_VALUE
 
@@ -284,18 +305,16 @@ async def edit_profile_value(update: Update, context: ContextTypes.DEFAULT_TYPE)
     new_value = update.message.text.strip()
     field = context.user_data.get("editing_field")
     telegram_user_id = update.message.from_user.id
-    db = SessionLocal()
 
     if field == "study_year":
         try:
             new_value = int(new_value)
         except ValueError:
             await update.message.reply_text("Study year must be a number, try again or cancel editing.",
-                                            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("Cancel Editing", callback_data="cancel_editing")]]))
+                                            reply_markup=cancel_editing_inline_markup)
             return EDIT_VALUE
 
-    updated_user = update_user(db, telegram_id=telegram_user_id, **{field: new_value})
-    db.close()
+    updated_user = await update_user(context.db, telegram_id=telegram_user_id, **{field: new_value})
 
     if updated_user:
         await update.message.reply_text(f"{field.capitalize()} updated successfully!", reply_markup=main_menu_markup)
@@ -303,7 +322,7 @@ async def edit_profile_value(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await update.message.reply_text("Could not update the profile. Please try again.", reply_markup=main_menu_markup)
 
     # Show updated profile again
-    show_profile(update, context)
+    await show_profile(update, context, updated_user)
     return ConversationHandler.END
 
 edit_profile_conv = ConversationHandler(
@@ -320,9 +339,7 @@ edit_profile_conv = ConversationHandler(
 #####################
 async def delete_profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     telegram_user_id = update.effective_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    db.close()
+    user = await get_user_by_telegram_id(context.db, telegram_user_id)
     if not user:
         await update.message.reply_text("You have no profile to delete.", reply_markup=main_menu_markup)
         return ConversationHandler.END
@@ -337,13 +354,11 @@ async def confirm_delete_profile(update: Update, context: ContextTypes.DEFAULT_T
     text = update.message.text.strip()
     if text == "papafranchesco is genius":
         telegram_user_id = update.message.from_user.id
-        db = SessionLocal()
-        user = get_user_by_telegram_id(db, telegram_user_id)
-        if user:
-            db.delete(user)
-            db.commit()
-        db.close()
-        await update.message.reply_text("Your profile has been deleted.", reply_markup=main_menu_markup)
+        deleted = await delete_user(context.db, telegram_user_id)
+        if deleted:
+            await update.message.reply_text("Your profile has been deleted.", reply_markup=main_menu_markup)
+        else:
+            await update.message.reply_text("You have no profile to delete.", reply_markup=main_menu_markup)
     else:
         await update.message.reply_text("Profile deletion canceled or phrase not matched.", reply_markup=main_menu_markup)
     return ConversationHandler.END
@@ -381,98 +396,129 @@ async def show_likes_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 #####################
 # Browse & Apply Tasks (Talents)
 #####################
+async def _render_tasks_page(context: ContextTypes.DEFAULT_TYPE, page: int):
+    """Return (text, inline markup) for one page of tasks, or None if the page is empty."""
+    tasks = await get_task_summaries(context.db, offset=page * TASKS_PAGE_SIZE, limit=TASKS_PAGE_SIZE + 1)
+    if not tasks:
+        return None
+
+    has_next = len(tasks) > TASKS_PAGE_SIZE
+    lines = ["Available Tasks:"]
+    lines.extend(
+        f"ID: {t.id}, Desc: {t.description[:50]}..., Categories: {t.categories or 'N/A'}, Reward: {t.reward or 'N/A'}"
+        for t in tasks[:TASKS_PAGE_SIZE]
+    )
+    return "\n".join(lines), tasks_page_inline_keyboard(page, has_next)
+
+async def _is_talent(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = await get_user_by_telegram_id(context.db, update.effective_user.id)
+    return bool(user) and user.role == UserRole.TALENT
+
 async def browse_tasks_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    telegram_user_id = update.effective_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
-    if not user or user.role != UserRole.TALENT:
+    if not await _is_talent(update, context):
         await update.message.reply_text("Only talents can browse tasks.", reply_markup=main_menu_markup)
-        db.close()
         return
 
-    tasks = get_all_tasks(db)
-    db.close()
-    if not tasks:
+    page = await _render_tasks_page(context, 0)
+    if not page:
         await update.message.reply_text("No tasks available at the moment.", reply_markup=main_menu_markup)
         return
 
-    msg = "Available Tasks:\n"
-    for t in tasks:
-        msg += f"ID: {t.id}, Desc: {t.description[:50]}..., Categories: {t.categories or 'N/A'}, Reward: {t.reward or 'N/A'}\n"
-    await update.message.reply_text(msg, reply_markup=main_menu_markup)
+    msg, markup = page
+    await update.message.reply_text(msg, reply_markup=markup or main_menu_markup)
+
+async def browse_tasks_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    await query.answer()
+
+    # Re-check: the page message may outlive the user's registration or role
+    if not await _is_talent(update, context):
+        await query.edit_message_text("Only talents can browse tasks.")
+        return
+
+    page_number = int(query.data.split(":")[1])
+    page = await _render_tasks_page(context, page_number)
+    if not page:
+        await query.edit_message_text("No more tasks available.")
+        return
+
+    msg, markup = page
+    await query.edit_message_text(msg, reply_markup=markup)
 
 async def apply_task_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     telegram_user_id = update.message.from_user.id
-    db = SessionLocal()
-    user = get_user_by_telegram_id(db, telegram_user_id)
+    user = await get_user_by_telegram_id(context.db, telegram_user_id)
     if not user or user.role != UserRole.TALENT:
         await update.message.reply_text("Only talents can apply to tasks.", reply_markup=main_menu_markup)
-        db.close()
         return
 
     parts = update.message.text.split()
     if len(parts) < 2:
         await update.message.reply_text("Usage: /apply_task <task_id>", reply_markup=main_menu_markup)
-        db.close()
         return
     try:
         task_id = int(parts[1])
     except ValueError:
         await update.message.reply_text("Task ID must be a number.", reply_markup=main_menu_markup)
-        db.close()
         return
 
-    task = get_task_by_id(db, task_id)
-    if not task:
-        await update.message.reply_text("Task not found.", reply_markup=main_menu_markup)
-        db.close()
-        return
+    result = await like_task(context.db, from_user_id=user.id, task_id=task_id)
 
-    create_reaction(db, from_user_id=user.id, to_user_id=task.owner_id, reaction_type=ReactionType.LIKE)
-    if check_mutual_like(db, user.id, task.owner_id):
-        create_match(db, user.id, task.owner_id)
+    if not result:
+        await update.message.reply_text("Task not found.", reply_markup=main_menu_markup)
+    elif result.is_match:
+        # The employer notification doesn't need to hold up the applicant's reply; the application
+        # keeps a reference to the task and routes any failure to error_handler
+        context.application.create_task(
+            context.bot.send_message(chat_id=result.owner_telegram_id, text="You have a new match!"),
+            update=update
+        )
         await update.message.reply_text("Applied successfully, and it's a match!", reply_markup=main_menu_markup)
-        employer_user = db.query(task.owner.__class__).filter_by(id=task.owner_id).first()
-        if employer_user:
-            await context.bot.send_message(chat_id=employer_user.telegram_id, text="You have a new match!")
     else:
         await update.message.reply_text("Applied successfully!", reply_markup=main_menu_markup)
 
-    db.close()
-
 #####################
 # Handle Menu Buttons as Messages
 #####################
+async def unrecognized_option(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text("Unrecognized option. Use the menu buttons or /help for assistance.",
+                                    reply_markup=main_menu_markup)
+
+# Keys are the main menu button labels, lowercased
+menu_dispatch = {
+    "help": help_command,
+    "profile": profile_command,
+    "recommendations": recommendations_command,
+    "show my likes": show_likes_command
+}
+
 async def handle_menu_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    text = update.message.text.strip().lower()
-    if text == "help":
-        await help_command(update, context)
-    elif text == "profile":
-        telegram_user_id = update.effective_user.id
-        db = SessionLocal()
-        user = get_user_by_telegram_id(db, telegram_user_id)
-        db.close()
-        if not user:
-            await update.message.reply_text("You are not registered. Use /register first.", reply_markup=main_menu_markup)
-        else:
-            show_profile(update, context)
-    elif text == "recommendations":
-        await recommendations_command(update, context)
-    elif text == "show my likes":
-        await show_likes_command(update, context)
-    else:
-        await update.message.reply_text("Unrecognized option. Use the menu buttons or /help for assistance.",
-                                        reply_markup=main_menu_markup)
+    handler = menu_dispatch.get(update.message.text.strip().lower(), unrecognized_option)
+    await handler(update, context)
 
 #####################
 # Main Function
 #####################
 def main():
-    application = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).build()
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    application = (
+        ApplicationBuilder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(PerChatUpdateProcessor(256))
+        # Throttle all outgoing Bot API calls to Telegram's ~30 msg/s limit and retry on RetryAfter
+        .rate_limiter(AIORateLimiter(overall_max_rate=30, overall_time_period=1, max_retries=3))
+        .build()
+    )
 
     # Error handler
     application.add_error_handler(error_handler)
 
+    # Per-update DB session: opened before any other group runs, closed after all of them
+    application.add_handler(TypeHandler(Update, open_db_session), group=-1)
+    application.add_handler(TypeHandler(Update, close_db_session), group=99)
+
     # Command Handlers
     application.add_handler(CommandHandler("start", start_command))
     application.add_handler(register_conv)
@@ -492,11 +538,25 @@ def main():
     application.add_handler(CallbackQueryHandler(profile_callback, pattern="^(edit_profile|save_profile)$"))
     application.add_handler(CallbackQueryHandler(edit_profile_callback, pattern="^(edit_name|edit_description|edit_university|edit_study_year|cancel_editing)$"))
 
+    # Browse tasks pagination
+    application.add_handler(CallbackQueryHandler(browse_tasks_callback, pattern=r"^tasks:\d+$"))
+
     # The global menu text handler is added LAST to avoid interfering with conversation states
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_menu_buttons))
 
     logger.info("Bot is running...")
-    application.run_polling()
+    if WEBHOOK_URL:
+        if not WEBHOOK_SECRET:
+            raise RuntimeError("WEBHOOK_SECRET must be set when running in webhook mode")
+        application.run_webhook(
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path=TELEGRAM_BOT_TOKEN,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{TELEGRAM_BOT_TOKEN}",
+            secret_token=WEBHOOK_SECRET
+        )
+    else:
+        application.run_polling()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+import asyncio
+import os
+import re
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.crud.crud_reaction import _like_task_statement, like_task
+from app.db.database import Base
+from app.models.models import Match, Reaction, ReactionType, Task, User, UserRole
+
+# e.g. postgresql+asyncpg://postgres@localhost/innovedge_test -- the schema is created and dropped per test
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def _compiled_sql():
+    sql = str(_like_task_statement(from_user_id=1, task_id=2).compile(dialect=postgresql.asyncpg.dialect()))
+    return " ".join(sql.split())
+
+
+def test_statement_writes_only_for_an_existing_task():
+    sql = _compiled_sql()
+    # Both inserts draw their rows from the target CTE, which is empty for an unknown task
+    assert re.search(r"new_reaction AS \(INSERT INTO reactions .* SELECT .* FROM target RETURNING", sql)
+    assert re.search(r"new_match AS \(INSERT INTO matches .* SELECT .* FROM target WHERE EXISTS", sql)
+    assert sql.endswith("FROM target")
+
+
+def test_statement_matches_only_on_a_reverse_like():
+    sql = _compiled_sql()
+    probe = re.search(r"WHERE EXISTS \(SELECT \* FROM reactions WHERE (.*?)\) RETURNING matches.id", sql).group(1)
+    assert "reactions.from_user_id = target.owner_id" in probe
+    assert "reactions.to_user_id = $1::INTEGER" in probe
+    assert "reactions.reaction_type = $" in probe
+    # The probe reads the reactions table, not the new_reaction CTE, so it cannot see this call's LIKE
+    assert "new_reaction" not in probe
+    assert "EXISTS (SELECT new_match.id FROM new_match) AS is_match" in sql
+
+
+needs_postgres = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+
+def _run_on_postgres(scenario):
+    async def wrapper():
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                await scenario(db)
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+async def _seed(db):
+    talent = User(telegram_id=1001, name="Tal", role=UserRole.TALENT)
+    employer = User(telegram_id=2002, name="Emp", role=UserRole.EMPLOYER)
+    db.add_all([talent, employer])
+    await db.flush()
+    task = Task(owner_id=employer.id, description="Landing page")
+    db.add(task)
+    await db.commit()
+    return talent, employer, task
+
+
+async def _count(db, model):
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@needs_postgres
+def test_unknown_task_writes_nothing():
+    async def scenario(db):
+        talent, _, _ = await _seed(db)
+        assert await like_task(db, from_user_id=talent.id, task_id=999) is None
+        assert await _count(db, Reaction) == 0
+        assert await _count(db, Match) == 0
+
+    _run_on_postgres(scenario)
+
+
+@needs_postgres
+def test_like_without_reverse_like_is_not_a_match():
+    async def scenario(db):
+        talent, employer, task = await _seed(db)
+        db.add(Reaction(from_user_id=employer.id, to_user_id=talent.id, reaction_type=ReactionType.DISLIKE))
+        await db.commit()
+
+        row = await like_task(db, from_user_id=talent.id, task_id=task.id)
+        assert row.owner_telegram_id == 2002
+        assert row.is_match is False
+        reactions = (await db.execute(
+            select(Reaction.from_user_id, Reaction.to_user_id, Reaction.reaction_type)
+            .where(Reaction.from_user_id == talent.id)
+        )).all()
+        assert reactions == [(talent.id, employer.id, ReactionType.LIKE)]
+        assert await _count(db, Match) == 0
+
+    _run_on_postgres(scenario)
+
+
+@needs_postgres
+def test_prior_reverse_like_records_a_match():
+    async def scenario(db):
+        talent, employer, task = await _seed(db)
+        db.add(Reaction(from_user_id=employer.id, to_user_id=talent.id, reaction_type=ReactionType.LIKE))
+        await db.commit()
+
+        row = await like_task(db, from_user_id=talent.id, task_id=task.id)
+        assert row.is_match is True
+        matches = (await db.execute(select(Match.user1_id, Match.user2_id))).all()
+        assert matches == [(talent.id, employer.id)]
+
+    _run_on_postgres(scenario)
+
+
+@needs_postgres
+def test_probe_does_not_see_the_like_being_inserted():
+    async def scenario(db):
+        _, employer, task = await _seed(db)
+        # Liking your own task inserts (employer -> employer), which would satisfy the probe if it were visible
+        row = await like_task(db, from_user_id=employer.id, task_id=task.id)
+        assert row.is_match is False
+        assert await _count(db, Reaction) == 1
+        assert await _count(db, Match) == 0
+
+    _run_on_postgres(scenario)
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.crud.crud_task import create_task, get_task_summaries
+from app.crud.crud_user import create_user, get_user_by_telegram_id, update_user, user_cache
+from app.db.database import Base
+from app.models.models import UserRole
+
+
+async def _make_sessionmaker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+def test_cached_user_survives_failed_write_in_same_session():
+    async def scenario():
+        user_cache.clear()
+        engine, session_factory = await _make_sessionmaker()
+        try:
+            db = session_factory()
+            employer = await create_user(db, telegram_id=42, name="Ann", role=UserRole.EMPLOYER)
+            with pytest.raises(IntegrityError):
+                # description is NOT NULL, so the flush fails and the session rolls back
+                await create_task(db, owner_id=employer.id, description=None)
+            await db.rollback()
+            await db.close()
+
+            async with session_factory() as db:
+                user = await get_user_by_telegram_id(db, 42)
+            assert user.role == UserRole.EMPLOYER
+            assert user.name == "Ann"
+        finally:
+            user_cache.clear()
+            await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_helpers_release_the_connection_before_returning():
+    async def scenario():
+        user_cache.clear()
+        engine, session_factory = await _make_sessionmaker()
+        try:
+            async with session_factory() as db:
+                employer = await create_user(db, telegram_id=7, name="Bob", role=UserRole.EMPLOYER)
+                assert not db.in_transaction()
+                await create_task(db, owner_id=employer.id, description="Build a landing page")
+                assert not db.in_transaction()
+                await update_user(db, telegram_id=7, university="MIT")
+                assert not db.in_transaction()
+                assert await update_user(db, telegram_id=404, university="MIT") is None
+                assert not db.in_transaction()
+
+                user_cache.clear()
+                user = await get_user_by_telegram_id(db, 7)
+                assert not db.in_transaction()
+                assert user.university == "MIT"
+
+                tasks = await get_task_summaries(db)
+                assert not db.in_transaction()
+                assert [t.description for t in tasks] == ["Build a landing page"]
+        finally:
+            user_cache.clear()
+            await engine.dispose()
+
+    asyncio.run(scenario())
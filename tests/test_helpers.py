@@ -0,0 +1,43 @@
+from app.utils.helpers import cache_truthy_results
+
+
+class FakeCategorizer:
+    def __init__(self, result="web"):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return self.result
+
+
+def test_normalized_variants_share_a_cache_entry():
+    categorizer = FakeCategorizer()
+    categorize = cache_truthy_results(categorizer, maxsize=16)
+
+    assert categorize("Web  Development") == "web"
+    assert categorize("web development") == "web"
+    assert categorize("  WEB development\n") == "web"
+    assert categorizer.calls == ["web development"]
+
+
+def test_falsy_results_are_not_cached():
+    categorizer = FakeCategorizer(result=None)
+    categorize = cache_truthy_results(categorizer, maxsize=16)
+
+    assert categorize("python developer") is None
+    categorizer.result = "programming"
+    assert categorize("python developer") == "programming"
+    assert categorize("python developer") == "programming"
+    assert categorizer.calls == ["python developer", "python developer"]
+
+
+def test_least_recently_used_entry_is_evicted():
+    categorizer = FakeCategorizer()
+    categorize = cache_truthy_results(categorizer, maxsize=2)
+
+    categorize("a")
+    categorize("b")
+    categorize("a")
+    categorize("c")
+    assert set(categorize.cache) == {"a", "c"}
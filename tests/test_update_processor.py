@@ -0,0 +1,54 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from telegram import Chat, Message, Update
+
+from app.bots.update_processor import PerChatUpdateProcessor
+
+
+def _update(update_id: int, chat_id: int):
+    chat = Chat(id=chat_id, type=Chat.PRIVATE)
+    message = Message(message_id=update_id, date=datetime.now(timezone.utc), chat=chat)
+    return Update(update_id=update_id, message=message)
+
+
+def test_busy_chat_does_not_hold_slots_needed_by_other_chats():
+    async def scenario():
+        processor = PerChatUpdateProcessor(4)
+        finished = {}
+
+        async def handle(name):
+            await asyncio.sleep(0.2)
+            finished[name] = time.monotonic() - start
+
+        start = time.monotonic()
+        flood = [processor.process_update(_update(i, chat_id=1), handle(f"a{i}")) for i in range(5)]
+        other = processor.process_update(_update(99, chat_id=2), handle("b"))
+        await asyncio.gather(*flood, other)
+        return finished
+
+    finished = asyncio.run(scenario())
+    assert finished["b"] < 0.35
+    # Updates from the same chat still run one after another, in order
+    assert [name for name in sorted(finished, key=finished.get) if name.startswith("a")] == [f"a{i}" for i in range(5)]
+    assert finished["a4"] >= 0.95
+
+
+def test_concurrency_is_capped_across_chats():
+    async def scenario():
+        processor = PerChatUpdateProcessor(4)
+        running = 0
+        peak = 0
+
+        async def handle():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        await asyncio.gather(*(processor.process_update(_update(i, chat_id=i), handle()) for i in range(10)))
+        return peak
+
+    assert asyncio.run(scenario()) == 4